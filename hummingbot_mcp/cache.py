@@ -0,0 +1,56 @@
+"""
+Async TTL cache for API responses that change rarely
+"""
+
+import asyncio
+import time
+import weakref
+from collections.abc import Callable, Coroutine, Hashable
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache(Generic[T]):
+    """Cache values per key for a fixed number of seconds
+
+    Concurrent lookups of the same key share one fetch. Failed fetches are not cached.
+    """
+
+    _instances: "weakref.WeakSet[TTLCache]" = weakref.WeakSet()
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: dict[Hashable, tuple[float, T]] = {}
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+        self._generation = 0
+        TTLCache._instances.add(self)
+
+    async def get(self, key: Hashable, fetch: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """Return the cached value for key, calling fetch to refresh it once the TTL has expired"""
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                return entry[1]
+            generation = self._generation
+            value = await fetch()
+            # Don't store a value fetched before the cache was cleared, it may come from the old server
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic(), value)
+            return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop the cached value for key so the next lookup fetches it again"""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached value"""
+        self._entries.clear()
+        self._generation += 1
+
+
+def clear_all_caches() -> None:
+    """Clear every TTL cache, e.g. after switching to a different API server"""
+    for cache in list(TTLCache._instances):
+        cache.clear()
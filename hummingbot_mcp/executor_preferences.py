@@ -19,6 +19,11 @@ logger = logging.getLogger("hummingbot-mcp")
 PREFERENCES_DIR = Path.home() / ".hummingbot_mcp"
 PREFERENCES_FILE = PREFERENCES_DIR / "executor_preferences.md"
 
+# Patterns that don't depend on the executor type are compiled once
+_YAML_BLOCK_RE = re.compile(r'```yaml\s*\n([\s\S]*?)```')
+_FOOTER_RE = re.compile(r'\n---\s*\n\*Last updated:')
+_LAST_UPDATED_RE = re.compile(r'\*Last updated:.*\*')
+
 # Default template for the preferences file
 DEFAULT_PREFERENCES_TEMPLATE = """# Executor Preferences
 
@@ -137,7 +142,7 @@ class ExecutorPreferencesManager:
         # Create default preferences file if it doesn't exist
         if not self.preferences_path.exists():
             self._write_template()
-            logger.info(f"Created default executor preferences at {self.preferences_path}")
+            logger.info("Created default executor preferences at %s", self.preferences_path)
 
     def _write_template(self) -> None:
         """Write the default template to the preferences file."""
@@ -162,11 +167,8 @@ class ExecutorPreferencesManager:
         Returns:
             Dictionary mapping executor type to its configuration
         """
-        # Pattern to match YAML code blocks
-        yaml_pattern = r'```yaml\s*\n([\s\S]*?)```'
-
         defaults = {}
-        matches = re.findall(yaml_pattern, content)
+        matches = _YAML_BLOCK_RE.findall(content)
 
         for yaml_content in matches:
             try:
@@ -177,7 +179,7 @@ class ExecutorPreferencesManager:
                         if config and isinstance(config, dict):
                             defaults[executor_type] = config
             except yaml.YAMLError as e:
-                logger.warning(f"Failed to parse YAML block: {e}")
+                logger.warning("Failed to parse YAML block: %s", e)
                 continue
 
         return defaults
@@ -265,10 +267,8 @@ class ExecutorPreferencesManager:
                     )
             else:
                 # No section found, append before the footer
-                footer_pattern = r'\n---\s*\n\*Last updated:'
-                if re.search(footer_pattern, content):
-                    content = re.sub(
-                        footer_pattern,
+                if _FOOTER_RE.search(content):
+                    content = _FOOTER_RE.sub(
                         f"\n### {executor_type.replace('_', ' ').title()} Defaults\n\n{new_block}\n\n---\n\n*Last updated:",
                         content
                     )
@@ -279,14 +279,10 @@ class ExecutorPreferencesManager:
         # Update the last updated timestamp
         from datetime import datetime
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        content = re.sub(
-            r'\*Last updated:.*\*',
-            f'*Last updated: {timestamp}*',
-            content
-        )
+        content = _LAST_UPDATED_RE.sub(f'*Last updated: {timestamp}*', content)
 
         self._write_content(content)
-        logger.info(f"Updated defaults for {executor_type}")
+        logger.info("Updated defaults for %s", executor_type)
 
     def merge_with_defaults(self, executor_type: str, user_config: dict[str, Any]) -> dict[str, Any]:
         """Merge user configuration with stored defaults.
@@ -13,6 +13,7 @@ Key components:
 # Base utilities (commonly used across formatters)
 from .base import (
     format_currency,
+    format_json,
     format_number,
     format_percentage,
     format_table_separator,
@@ -79,6 +80,7 @@ __all__ = [
     "format_gateway_clmm_pool_result",
     # Base utilities
     "format_currency",
+    "format_json",
     "format_number",
     "format_percentage",
     "format_table_separator",
@@ -60,7 +60,7 @@ def format_connector_result(result: dict[str, Any]) -> str:
             f"Next Step: {result.get('next_step', '')}"
         )
 
-    elif result_action in ["credentials_added", "credentials_overridden"]:
+    elif result_action in {"credentials_added", "credentials_overridden"}:
         return (
             f"\u2705 {result.get('message', '')}\n\n"
             f"Account: {result.get('account', '')}\n"
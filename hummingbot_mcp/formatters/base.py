@@ -9,6 +9,8 @@ from dictionaries with fallback support.
 from datetime import datetime, timezone
 from typing import Any
 
+import orjson
+
 
 def format_number(num: Any, decimals: int = 2, compact: bool = True) -> str:
     """
@@ -228,6 +230,22 @@ def format_table_separator(length: int = 120, char: str = "-") -> str:
     return char * length
 
 
+def format_json(data: Any) -> str:
+    """
+    Serialize raw API data as compact JSON for LLM consumption.
+
+    Much cheaper than str() on large nested dicts/lists, and the output is valid JSON.
+    Values orjson cannot serialize natively (e.g. Decimal) fall back to str().
+
+    Args:
+        data: Data to serialize
+
+    Returns:
+        JSON string
+    """
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # ==============================================================================
 # Field Accessor Utilities
 # ==============================================================================
@@ -16,6 +16,9 @@ from .base import (
     truncate_string,
 )
 
+# Internal fields injected by the MCP layer, not user-supplied
+INTERNAL_EXECUTOR_FIELDS = {"type", "executor_type", "id"}
+
 
 def format_executor_types_table(executor_types: list[dict[str, Any]]) -> str:
     """
@@ -329,7 +332,7 @@ def format_executor_schema_table(schema: dict[str, Any], defaults: dict[str, Any
     rows = []
     for param_name, param_info in properties.items():
         # Skip internal fields
-        if param_name in ["id", "type", "executor_type"]:
+        if param_name in INTERNAL_EXECUTOR_FIELDS:
             continue
 
         if isinstance(param_info, dict):
@@ -418,14 +421,12 @@ def format_executor_summary(summary: dict[str, Any]) -> str:
         output += f"Total Volume: {format_currency(total_volume)}\n"
 
     # By type breakdown
-    by_type = summary.get("by_type", {})
     if by_type:
         output += "\nBy Type:\n"
         for exec_type, count in by_type.items():
             output += f"  - {exec_type}: {count}\n"
 
     # By status breakdown
-    by_status = summary.get("by_status", {})
     if by_status:
         output += "\nBy Status:\n"
         for status, count in by_status.items():
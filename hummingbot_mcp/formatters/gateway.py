@@ -30,7 +30,7 @@ def format_gateway_container_result(result: dict[str, Any]) -> str:
         logs = result.get("logs", "No logs available")
         return f"Gateway Container Logs:\n\n{logs}"
 
-    elif result_action in ["start", "stop", "restart"]:
+    elif result_action in {"start", "stop", "restart"}:
         message = result.get("message", "")
         return f"Gateway Container: {message}"
 
@@ -100,7 +100,7 @@ def format_gateway_config_result(result: dict[str, Any]) -> str:
                 output += f"- {chain_name}: {address}\n"
             return output
 
-    elif result_action in ["add", "delete", "update"]:
+    elif result_action in {"add", "delete", "update"}:
         message = result.get("result", {}).get("message", "")
         return f"Gateway Config {result_action.title()}: {message}"
 
@@ -7,10 +7,11 @@ import logging
 import os
 import platform
 
+import aiohttp
 from hummingbot_api_client import HummingbotAPIClient
 
 from hummingbot_mcp.exceptions import MaxConnectionsAttemptError
-from hummingbot_mcp.settings import settings
+from hummingbot_mcp.settings import get_settings
 
 logger = logging.getLogger("hummingbot-mcp")
 
@@ -23,16 +24,28 @@ class HummingbotClient:
         self._initialized = False
         self._last_error: Exception | None = None
         self._failed_url: str | None = None
+        self._init_lock = asyncio.Lock()
 
     async def initialize(self, force: bool = False) -> HummingbotAPIClient:
         """Initialize API client with retry logic
 
+        Concurrent callers share a single connection attempt.
+
         Args:
             force: Force re-initialization even if previously failed
         """
         if self._client is not None and self._initialized:
             return self._client
 
+        async with self._init_lock:
+            if self._client is not None and self._initialized:
+                return self._client
+            return await self._connect(force)
+
+    async def _connect(self, force: bool) -> HummingbotAPIClient:
+        """Create the API client and verify the connection, retrying on failure"""
+        settings = get_settings()
+
         # If we've already failed for this URL, don't retry unless forced or URL changed
         if not force and self._failed_url == settings.api_url and self._last_error:
             raise self._last_error
@@ -41,31 +54,41 @@ class HummingbotClient:
         self._failed_url = None
         self._last_error = None
 
+        # One client (and HTTP session) is shared by all attempts, so retries reuse its connection pool
+        # and DNS cache. Creating the session performs no I/O. It is only published on success.
+        client = HummingbotAPIClient(
+            base_url=settings.api_url,
+            username=settings.api_username,
+            password=settings.api_password,
+            timeout=settings.client_timeout,
+        )
+        await client.init()
+
         last_error = None
+        attempts = 0
         for attempt in range(settings.max_retries):
+            attempts = attempt + 1
             try:
-                self._client = HummingbotAPIClient(
-                    base_url=settings.api_url,
-                    username=settings.api_username,
-                    password=settings.api_password,
-                    timeout=settings.client_timeout,
-                )
-
-                # Initialize and test connection
-                await self._client.init()
-                await self._client.accounts.list_accounts()
+                # Test connection
+                await client.accounts.list_accounts()
 
+                self._client = client
                 self._initialized = True
-                logger.info(f"Successfully connected to Hummingbot API at {settings.api_url}")
-                return self._client
+                logger.info("Successfully connected to Hummingbot API at %s", settings.api_url)
+                return client
+
+            except asyncio.CancelledError:
+                await client.close()
+                raise
 
             except Exception as e:
                 last_error = e
                 error_str = str(e).lower()
-                logger.warning(f"Connection attempt {attempt + 1} failed: {e}")
+                logger.warning("Connection attempt %s failed: %s", attempt + 1, e)
 
                 # Don't retry on authentication errors
                 if "401" in error_str or "unauthorized" in error_str or "authentication" in error_str:
+                    await client.close()
                     self._failed_url = settings.api_url
                     self._last_error = MaxConnectionsAttemptError(
                         f"❌ Authentication failed when connecting to Hummingbot API at {settings.api_url}\n\n"
@@ -80,10 +103,15 @@ class HummingbotClient:
                     )
                     raise self._last_error
 
+                # Only timeouts and connection failures are worth retrying
+                if not isinstance(e, (asyncio.TimeoutError, aiohttp.ClientConnectionError)):
+                    break
+
                 if attempt < settings.max_retries - 1:
-                    await asyncio.sleep(settings.retry_delay)
+                    await asyncio.sleep(settings.retry_delay * 2 ** attempt)
 
-        # All retries failed - save failure state and provide helpful error message
+        # All retries failed - release the session, save failure state and provide helpful error message
+        await client.close()
         self._failed_url = settings.api_url
         error_str = str(last_error).lower() if last_error else ""
 
@@ -103,7 +131,7 @@ class HummingbotClient:
             # Add Docker networking warning for localhost URLs
             if "localhost" in settings.api_url and os.getenv("DOCKER_CONTAINER") == "true":
                 system = platform.system()
-                if system in ["Darwin", "Windows"]:
+                if system in {"Darwin", "Windows"}:
                     error_message += (
                         f"⚠️  Docker Networking Notice:\n"
                         f"You're running on {system} and trying to connect to 'localhost'.\n"
@@ -117,7 +145,7 @@ class HummingbotClient:
         else:
             self._last_error = MaxConnectionsAttemptError(
                 f"❌ Failed to connect to Hummingbot API at {settings.api_url}\n\n"
-                f"Connection failed after {settings.max_retries} attempts.\n\n"
+                f"Connection failed after {attempts} attempt(s).\n\n"
                 f"💡 Solutions:\n"
                 f"  1. Check if the API is running and accessible\n"
                 f"  2. Verify your credentials are correct\n"
@@ -133,11 +161,15 @@ class HummingbotClient:
         return self._client
 
     async def close(self):
-        """Close the client connection and reset state"""
-        if self._client:
-            await self._client.close()
-            self._client = None
-            self._initialized = False
+        """Close the client connection and reset state
+
+        Waits for a connection attempt in progress so it is not torn down mid-connect.
+        """
+        async with self._init_lock:
+            if self._client:
+                await self._client.close()
+                self._client = None
+                self._initialized = False
             # Reset failure state to allow retry with new configuration
             self._failed_url = None
             self._last_error = None
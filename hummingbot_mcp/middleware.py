@@ -14,6 +14,18 @@ T = TypeVar("T")
 GATEWAY_LOG_HINT = "\n\n💡 Check gateway logs for more details: manage_gateway_container(action='get_logs')"
 
 
+def _log_tool_error(action_name: str, exc: Exception) -> None:
+    """Log a tool failure, keeping the traceback only for unexpected errors.
+
+    Expected failures (bad input, unreachable API) are frequent during exploration,
+    so they are logged as a single line without formatting a traceback.
+    """
+    if isinstance(exc, (ValueError, HBConnectionError)):
+        logger.warning("%s failed: %s", action_name, exc)
+    else:
+        logger.error("%s failed: %s", action_name, exc, exc_info=exc)
+
+
 def handle_errors(
     action_name: str,
     error_suffix: str = "",
@@ -34,11 +46,12 @@ def handle_errors(
             try:
                 return await func(*args, **kwargs)
             except HBConnectionError as e:
+                _log_tool_error(action_name, e)
                 raise ToolError(str(e))
             except ToolError:
                 raise
             except Exception as e:
-                logger.error(f"{action_name} failed: {str(e)}", exc_info=True)
+                _log_tool_error(action_name, e)
                 raise ToolError(f"Failed to {action_name}: {str(e)}{error_suffix}")
         return wrapper
     return decorator
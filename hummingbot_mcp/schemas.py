@@ -7,10 +7,12 @@ and documentation across the codebase.
 """
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from hummingbot_mcp.settings import settings
+from hummingbot_mcp.settings import get_settings
 
+# Spaces and hyphens in connector/executor names are normalized to underscores
+_NAME_SEPARATORS = str.maketrans({" ": "_", "-": "_"})
 
 # ==============================================================================
 # Account Management Schemas
@@ -34,6 +36,9 @@ class SetupConnectorRequest(BaseModel):
     3. action="delete" + connector + account -> Delete the credential
     """
 
+    # Requests are built once per tool call and only read afterwards
+    model_config = ConfigDict(frozen=True)
+
     action: Literal["setup", "delete"] | None = Field(
         default=None,
         description="Action to perform. 'setup' (default) to add/update credentials, 'delete' to remove credentials.",
@@ -73,7 +78,7 @@ class SetupConnectorRequest(BaseModel):
         """Validate connector name format if provided"""
         if v is not None:
             # Convert to lowercase and replace spaces/hyphens with underscores
-            v = v.lower().replace(" ", "_").replace("-", "_")
+            v = v.lower().translate(_NAME_SEPARATORS)
 
             # Basic validation - should be alphanumeric with underscores
             if not v.replace("_", "").isalnum():
@@ -86,9 +91,7 @@ class SetupConnectorRequest(BaseModel):
     def validate_credentials(cls, v: dict[str, Any] | None) -> dict[str, Any] | None:
         """Validate credentials format if provided"""
         if v is not None:
-            if not isinstance(v, dict):
-                raise ValueError("Credentials must be a dictionary/object")
-
+            # The field type already guarantees a dict by the time this validator runs
             if not v:  # Empty dict
                 raise ValueError("Credentials cannot be empty. Omit the field to see required fields.")
 
@@ -101,14 +104,14 @@ class SetupConnectorRequest(BaseModel):
                 else:
                     if not isinstance(value, str):
                         raise ValueError(f"Credential '{key}' must be a string")
-                    if not value.strip():  # Empty or whitespace-only
+                    if not value or value.isspace():  # Empty or whitespace-only
                         raise ValueError(f"Credential '{key}' cannot be empty")
 
         return v
 
     def get_account_name(self) -> str:
         """Get account name with fallback to default"""
-        return self.account or settings.default_account
+        return self.account or get_settings().default_account
 
     def get_flow_stage(self) -> str:
         """Determine which stage of the setup/delete flow we're in"""
@@ -157,6 +160,8 @@ class ManageExecutorsRequest(BaseModel):
     11. action="clear_position" + connector_name + trading_pair -> Clear position
     """
 
+    model_config = ConfigDict(frozen=True)
+
     action: Literal["create", "search", "stop", "get_logs", "get_preferences", "save_preferences", "reset_preferences", "positions_summary", "clear_position"] | None = Field(
         default=None,
         description="Action to perform. Leave empty to see executor types or show schema.",
@@ -260,7 +265,7 @@ class ManageExecutorsRequest(BaseModel):
     def validate_executor_type(cls, v: str | None) -> str | None:
         """Validate executor type format if provided."""
         if v is not None:
-            v = v.lower().replace(" ", "_").replace("-", "_")
+            v = v.lower().translate(_NAME_SEPARATORS)
         return v
 
     def get_flow_stage(self) -> str:
@@ -305,6 +310,8 @@ class GatewayContainerRequest(BaseModel):
     - get_logs: Retrieve Gateway container logs
     """
 
+    model_config = ConfigDict(frozen=True)
+
     action: Literal["get_status", "start", "stop", "restart", "get_logs"] = Field(
         description="Action to perform on Gateway container"
     )
@@ -355,6 +362,8 @@ class GatewayConfigRequest(BaseModel):
     - delete: Delete resource (tokens, wallets)
     """
 
+    model_config = ConfigDict(frozen=True)
+
     resource_type: Literal["chains", "networks", "tokens", "connectors", "pools", "wallets"] = Field(
         description="Type of resource to manage"
     )
@@ -490,6 +499,8 @@ class GatewaySwapRequest(BaseModel):
     4. action="search" + filters -> Query swap history
     """
 
+    model_config = ConfigDict(frozen=True)
+
     action: Literal["quote", "execute", "search", "get_status"] = Field(
         description="Action to perform: 'quote' (get price), 'execute' (perform swap), "
                     "'search' (query history), 'get_status' (check tx status)"
@@ -615,6 +626,8 @@ class GatewayCLMMRequest(BaseModel):
     To check on-chain positions, use `get_portfolio_overview` with `include_lp_positions=True`.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     action: Literal["list_pools", "get_pool_info"] = Field(
         description="Action to perform on CLMM pools"
     )
@@ -1,61 +1,114 @@
 """
 Main MCP server for Hummingbot API integration
 """
+from __future__ import annotations
 
 import asyncio
 import logging
+import queue
 import sys
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Literal
+from urllib.parse import urlparse
 
 from mcp.server.fastmcp import FastMCP
+from mcp.types import Tool as MCPTool
 
+from hummingbot_mcp.cache import clear_all_caches
 from hummingbot_mcp.formatters import (
-    format_active_bots_as_table,
-    format_bot_logs_as_table,
     format_connector_result,
     format_gateway_clmm_pool_result,
-    format_gateway_config_result,
-    format_gateway_container_result,
-    format_gateway_swap_result,
-    format_portfolio_as_table,
+    format_json,
 )
 from hummingbot_mcp.hummingbot_client import hummingbot_client
 from hummingbot_mcp.middleware import GATEWAY_LOG_HINT, handle_errors
 from hummingbot_mcp.schemas import (
     GatewayCLMMRequest,
-    GatewayConfigRequest,
-    GatewayContainerRequest,
-    GatewaySwapRequest,
     ManageExecutorsRequest,
     SetupConnectorRequest,
 )
-from hummingbot_mcp.settings import settings
+from hummingbot_mcp.settings import ServerConfig, _load_server_config, get_settings, reload_settings, save_server_config
+from hummingbot_mcp.tools import account as account_tools
 from hummingbot_mcp.tools import bot_management as bot_management_tools
 from hummingbot_mcp.tools import controllers as controllers_tools
 from hummingbot_mcp.tools import market_data as market_data_tools
 from hummingbot_mcp.tools import portfolio as portfolio_tools
 from hummingbot_mcp.tools import trading as trading_tools
-from hummingbot_mcp.tools.account import setup_connector as setup_connector_impl
-from hummingbot_mcp.tools.executors import manage_executors as manage_executors_impl
-from hummingbot_mcp.tools.gateway import (
-    manage_gateway_config as manage_gateway_config_impl,
-    manage_gateway_container as manage_gateway_container_impl,
+from hummingbot_mcp.tools.account import (
+    list_available_connectors as list_available_connectors_impl,
+    setup_connector as setup_connector_impl,
 )
+from hummingbot_mcp.tools.executors import manage_executors as manage_executors_impl
 from hummingbot_mcp.tools.gateway_clmm import explore_gateway_clmm_pools as explore_gateway_clmm_pools_impl
-from hummingbot_mcp.tools.gateway_swap import manage_gateway_swaps as manage_gateway_swaps_impl
 from hummingbot_mcp.tools.geckoterminal import explore_geckoterminal as explore_geckoterminal_impl
 from hummingbot_mcp.tools import history as history_tools
 
-# Configure root logger
-logging.basicConfig(
-    level="INFO",
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stderr)],
-)
+
+class _ISOFormatter(logging.Formatter):
+    """Formatter that renders timestamps with datetime.isoformat instead of localtime + strftime"""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        return datetime.fromtimestamp(record.created).isoformat(sep=" ", timespec="milliseconds")
+
+
 logger = logging.getLogger("hummingbot-mcp")
 
+
+def _setup_logging() -> QueueListener:
+    """Route all logging to stderr through a listener thread and return the started listener
+
+    Records are queued by the logging call and written by the listener thread,
+    so a slow stderr consumer never blocks the event loop.
+    """
+    log_handler = logging.StreamHandler(sys.stderr)
+    log_handler.setFormatter(_ISOFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    # Only the message is rendered before queueing; the stderr handler applies the full format
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, log_handler)
+    listener.start()
+
+    # Configure root logger (third-party libraries), replacing the handler FastMCP installs,
+    # and our own logger, which doesn't propagate to root
+    logging.basicConfig(level="INFO", handlers=[queue_handler], force=True)
+    logger.addHandler(queue_handler)
+    logger.propagate = False
+    # Never let a failing log handler surface as a traceback on stderr
+    logging.raiseExceptions = False
+    return listener
+
+
+class _HummingbotMCP(FastMCP):
+    """FastMCP server that builds the tool listing once instead of on every list_tools request"""
+
+    _tools_listing: list[MCPTool] | None = None
+
+    async def list_tools(self) -> list[MCPTool]:
+        if self._tools_listing is None:
+            self._tools_listing = await super().list_tools()
+        return self._tools_listing
+
+    def add_tool(self, *args: Any, **kwargs: Any) -> None:
+        self._tools_listing = None
+        super().add_tool(*args, **kwargs)
+
+    def remove_tool(self, name: str) -> None:
+        self._tools_listing = None
+        super().remove_tool(name)
+
+
 # Initialize FastMCP server
-mcp = FastMCP("hummingbot-mcp")
+mcp = _HummingbotMCP("hummingbot-mcp")
+
+
+def _formatted_output(result: dict[str, Any]) -> str:
+    """Return a tool result's formatted_output, serializing the raw result only when it is missing"""
+    if "formatted_output" in result:
+        return result["formatted_output"]
+    return format_json(result)
 
 
 # Account Management Tools
@@ -90,12 +143,16 @@ async def setup_connector(
         account: Account name to add credentials to. If not provided, prompts for account selection.
         confirm_override: Explicit confirmation to override existing connector. Required when connector already exists.
     """
+    client = await hummingbot_client.get_client()
+
+    # Discovery step: nothing to validate, skip building the request model
+    if action is None and connector is None and credentials is None and account is None and confirm_override is None:
+        return format_connector_result(await list_available_connectors_impl(client))
+
     request = SetupConnectorRequest(
         action=action, connector=connector, credentials=credentials,
         account=account, confirm_override=confirm_override,
     )
-
-    client = await hummingbot_client.get_client()
     result = await setup_connector_impl(client, request)
     return format_connector_result(result)
 
@@ -124,8 +181,6 @@ async def configure_server(
         username: API username
         password: API password
     """
-    from hummingbot_mcp.settings import ServerConfig, _load_server_config, save_server_config
-
     # No params → show active server
     if name is None and host is None and port is None and username is None and password is None:
         current = _load_server_config()
@@ -139,7 +194,6 @@ async def configure_server(
     # Build new config with partial updates
     current = _load_server_config()
 
-    from urllib.parse import urlparse
     parsed = urlparse(current.url)
     current_host = parsed.hostname or "localhost"
     current_port = parsed.port or 8000
@@ -159,8 +213,10 @@ async def configure_server(
 
     # Persist and apply
     save_server_config(new_config)
-    settings.reload_from_server_config(new_config)
+    reload_settings()
     await hummingbot_client.close()
+    # Cached connectors, credentials and schemas belong to the previous server
+    clear_all_caches()
 
     try:
         await hummingbot_client.initialize(force=True)
@@ -225,7 +281,7 @@ async def get_portfolio_overview(
             account_names=account_names,
             connector_names=connector_names
         )
-        return f"Portfolio Distribution:\n{result}"
+        return f"Portfolio Distribution:\n{format_json(result)}"
 
     # Normal portfolio overview
     result = await portfolio_tools.get_portfolio_overview(
@@ -347,7 +403,7 @@ async def search_history(
         position_addresses=position_addresses,
     )
 
-    return result.get("formatted_output", str(result))
+    return _formatted_output(result)
 
 
 # Market Data Tools
@@ -366,6 +422,7 @@ async def get_market_data(
             "snapshot", "volume_for_price", "price_for_volume", "quote_volume_for_price", "price_for_quote_volume"] | None = None,
         query_value: float | None = None,
         is_buy: bool = True,
+        max_rows: int = market_data_tools.MAX_CANDLE_ROWS,
 ) -> str:
     """Get market data: prices, candles, funding rates, or order book data.
 
@@ -386,6 +443,8 @@ async def get_market_data(
             'volume_for_price', 'price_for_volume', 'quote_volume_for_price', 'price_for_quote_volume'.
         query_value: Value for order book queries (required if query_type is not 'snapshot').
         is_buy: Side for order book queries (default: True for buy side).
+        max_rows: Maximum rows for 'candles' (default: 2000). Larger results are aggregated into
+            wider OHLCV candles and the effective interval is reported.
     """
     client = await hummingbot_client.get_client()
 
@@ -406,12 +465,17 @@ async def get_market_data(
             return "Error: 'trading_pair' is required for data_type='candles'"
         result = await market_data_tools.get_candles(
             client=client, connector_name=connector_name,
-            trading_pair=trading_pair, interval=interval, days=days,
+            trading_pair=trading_pair, interval=interval, days=days, max_rows=max_rows,
         )
+        total_candles = f"Total Candles: {result['total_candles']}"
+        interval_line = f"Interval: {result['bucket_interval']}"
+        if result["fetched_candles"] > result["total_candles"]:
+            total_candles += f" (aggregated from {result['fetched_candles']})"
+            interval_line += f" (aggregated from {result['interval']} candles)"
         return (
             f"Candles for {result['trading_pair']} on {result['connector_name']}:\n"
-            f"Interval: {result['interval']}\n"
-            f"Total Candles: {result['total_candles']}\n\n"
+            f"{interval_line}\n"
+            f"{total_candles}\n\n"
             f"{result['candles_table']}"
         )
 
@@ -534,7 +598,7 @@ async def manage_controllers(
         include_code=include_code,
     )
     # list/describe return formatted_output, upsert/delete return message
-    return result.get("formatted_output") or result.get("message", str(result))
+    return result.get("formatted_output") or result.get("message") or format_json(result)
 
 
 @mcp.tool()
@@ -760,7 +824,7 @@ async def manage_executors(
     client = await hummingbot_client.get_client()
     result = await manage_executors_impl(client, request)
 
-    return result.get("formatted_output", str(result))
+    return _formatted_output(result)
 
 
 @mcp.tool()
@@ -885,30 +949,67 @@ async def explore_geckoterminal(
         limit=limit,
         trade_volume_filter=trade_volume_filter,
     )
-    return result.get("formatted_output", str(result))
+    return _formatted_output(result)
+
+
+async def _warm_up():
+    """Connect to the API and prefill read-only caches while the stdio transport starts"""
+    try:
+        client = await hummingbot_client.get_client()
+    except Exception as e:
+        # Don't let a startup failure stick: the first tool call should retry the connection
+        await hummingbot_client.close()
+        logger.info("API not reachable at startup, will connect on first use: %s", e)
+        return
+
+    results = await asyncio.gather(
+        market_data_tools.get_candle_connectors(client),
+        account_tools.get_connector_names(client),
+        return_exceptions=True,
+    )
+    warmed = sum(1 for r in results if not isinstance(r, BaseException))
+    logger.info("Warmed %d/%d caches", warmed, len(results))
 
 
 async def _run():
     """Run the MCP server"""
+    settings = get_settings()
+
     # Setup logging once at application start
+    log_listener = _setup_logging()
     logger.info("Starting Hummingbot MCP Server")
-    logger.info(f"Configured API URL: {settings.api_url}")
-    logger.info(f"Default Account: {settings.default_account}")
-    logger.info("Server will connect to API on first use (lazy initialization)")
+    logger.info("Configured API URL: %s", settings.api_url)
+    logger.info("Default Account: %s", settings.default_account)
+    logger.info("Connecting to API in the background; tools will retry on first use if it is unavailable")
     logger.info("💡 Use 'configure_server' tool to view or update the API server connection")
 
     # Run the server with FastMCP
-    # Connection to API will happen lazily on first tool use
+    # Connection to API is attempted in the background; tools connect on first use if it failed
+    warm_up_task = asyncio.create_task(_warm_up())
     try:
         await mcp.run_stdio_async()
     finally:
+        warm_up_task.cancel()
         # Clean up client connection if it was initialized
         await hummingbot_client.close()
+        log_listener.stop()
+
+
+def _event_loop_factory():
+    """Return uvloop's loop factory when it is installed, otherwise None for the default asyncio loop"""
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
 
 
 def main():
     """Entry point for uvx/pip console_scripts."""
-    asyncio.run(_run())
+    with asyncio.Runner(loop_factory=_event_loop_factory()) as runner:
+        runner.run(_run())
 
 
 if __name__ == "__main__":
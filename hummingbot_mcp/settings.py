@@ -3,11 +3,12 @@ Configuration settings for Hummingbot MCP Server
 """
 
 import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 import aiohttp
 import yaml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from hummingbot_mcp.exceptions import ConfigurationError
 
@@ -58,6 +59,8 @@ def save_server_config(config: ServerConfig):
 class Settings(BaseModel):
     """Application settings"""
 
+    model_config = ConfigDict(frozen=True)
+
     # API Configuration
     api_url: str = Field(default="http://localhost:8000")
     api_username: str = Field(default="admin")
@@ -67,6 +70,8 @@ class Settings(BaseModel):
 
     # Connection settings
     connection_timeout: float = Field(default=30.0)
+    connect_timeout: float = Field(default=5.0)
+    read_timeout: float = Field(default=30.0)
     max_retries: int = Field(default=3)
     retry_delay: float = Field(default=2.0)
 
@@ -86,21 +91,24 @@ class Settings(BaseModel):
             raise ValueError(f"Log level must be one of: {valid_levels}")
         return v.upper()
 
-    @property
+    @cached_property
     def client_timeout(self) -> aiohttp.ClientTimeout:
-        """Get aiohttp ClientTimeout object"""
-        return aiohttp.ClientTimeout(total=self.connection_timeout)
-
-    def reload_from_server_config(self, config: ServerConfig):
-        """Reload API settings from a ServerConfig"""
-        self.api_url = config.url
-        self.api_username = config.username
-        self.api_password = config.password
-        self.server_name = config.name
+        """Get aiohttp ClientTimeout object
+
+        Connecting is bounded separately so an unreachable API fails fast instead of
+        consuming the whole request budget.
+        """
+        return aiohttp.ClientTimeout(
+            total=self.connection_timeout,
+            connect=self.connect_timeout,
+            sock_connect=self.connect_timeout,
+            sock_read=self.read_timeout,
+        )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings from server configuration"""
+    """Get application settings from server configuration (built once, on first use)"""
     try:
         server_config = _load_server_config()
 
@@ -110,6 +118,8 @@ def get_settings() -> Settings:
             api_password=server_config.password,
             server_name=server_config.name,
             connection_timeout=float(os.getenv("HUMMINGBOT_TIMEOUT", "30.0")),
+            connect_timeout=float(os.getenv("HUMMINGBOT_CONNECT_TIMEOUT", "5.0")),
+            read_timeout=float(os.getenv("HUMMINGBOT_READ_TIMEOUT", os.getenv("HUMMINGBOT_TIMEOUT", "30.0"))),
             max_retries=int(os.getenv("HUMMINGBOT_MAX_RETRIES", "3")),
             retry_delay=float(os.getenv("HUMMINGBOT_RETRY_DELAY", "2.0")),
             log_level=os.getenv("HUMMINGBOT_LOG_LEVEL", "INFO"),
@@ -118,5 +128,7 @@ def get_settings() -> Settings:
         raise ConfigurationError(f"Failed to load configuration: {e}")
 
 
-# Global settings instance
-settings = get_settings()
+def reload_settings() -> Settings:
+    """Drop the cached settings and rebuild them from the persisted server config"""
+    get_settings.cache_clear()
+    return get_settings()
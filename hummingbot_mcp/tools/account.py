@@ -5,23 +5,102 @@ import asyncio
 import logging
 from typing import Any
 
+from hummingbot_mcp.cache import TTLCache
 from hummingbot_mcp.exceptions import ToolError
 from hummingbot_mcp.schemas import SetupConnectorRequest
-from hummingbot_mcp.settings import settings
+from hummingbot_mcp.settings import get_settings
 
 logger = logging.getLogger("hummingbot-mcp")
 
+# Available connectors rarely change, so the list is cached for a few minutes
+CONNECTORS_TTL = 300.0
+_CONNECTORS_CACHE: TTLCache[list[str]] = TTLCache(CONNECTORS_TTL)
+
+# Required credential fields per connector, which change as rarely as the connector list,
+# stored with the rendered credentials example shown in show_config
+_CONFIG_MAP_CACHE: TTLCache[tuple[list[str], str]] = TTLCache(CONNECTORS_TTL)
+
+# Configured connectors per account, used for existence checks before add/delete
+CREDENTIALS_TTL = 30.0
+_CREDENTIALS_CACHE: TTLCache[set[str]] = TTLCache(CREDENTIALS_TTL)
+
+
+async def get_connector_names(client: Any) -> list[str]:
+    """Return the names of all available connectors, refreshing them once per TTL."""
+
+    async def fetch() -> list[str]:
+        connectors = await client.connectors.list_connectors()
+
+        # Handle both string and object responses from the API; the API returns one kind per response
+        if connectors and isinstance(connectors[0], str):
+            return list(connectors)
+        return [c.name if hasattr(c, "name") else str(c) for c in connectors]
+
+    return await _CONNECTORS_CACHE.get(None, fetch)
+
+
+async def _get_config_map(client: Any, connector_name: str) -> tuple[list[str], str]:
+    """Return the credential fields required by a connector and a credentials example, cached per connector."""
+
+    async def fetch() -> tuple[list[str], str]:
+        config_fields = await client.connectors.get_config_map(connector_name)
+
+        # Build a dictionary from the list of field names
+        credentials_dict = {field: f"your_{field}" for field in config_fields}
+        return config_fields, f"Use credentials={credentials_dict} to connect"
+
+    return await _CONFIG_MAP_CACHE.get(connector_name, fetch)
+
+
+async def _get_account_credentials(client: Any, account_name: str) -> set[str]:
+    """Return the connectors configured on an account, cached briefly per account.
+
+    Concurrent lookups for the same account share one request.
+    """
+
+    async def fetch() -> set[str]:
+        return set(await client.accounts.list_account_credentials(account_name=account_name) or [])
+
+    return await _CREDENTIALS_CACHE.get(account_name, fetch)
+
+
+def _invalidate_account_credentials(account_name: str) -> None:
+    """Drop the cached connectors for an account after its credentials change"""
+    _CREDENTIALS_CACHE.invalidate(account_name)
+
 
 async def _check_existing_connector(client: Any, account_name: str, connector_name: str) -> bool:
     """Check if a connector already exists for the given account"""
     try:
-        credentials = await client.accounts.list_account_credentials(account_name=account_name)
+        credentials = await _get_account_credentials(client, account_name)
         return connector_name in credentials
     except Exception as e:
-        logger.warning(f"Failed to check existing connector: {str(e)}")
+        logger.warning("Failed to check existing connector: %s", e)
         return False
 
 
+async def list_available_connectors(client: Any) -> dict[str, Any]:
+    """List available connectors and the connectors configured on each account (setup step 1)."""
+    connector_names, accounts = await asyncio.gather(get_connector_names(client), client.accounts.list_accounts())
+
+    current_accounts_str = "Current accounts: "
+    credentials = await asyncio.gather(
+        *(_get_account_credentials(client, account_name) for account_name in accounts)
+    )
+    for account, creds in zip(accounts, credentials):
+        current_accounts_str += f"{account}: {sorted(creds)}), "
+
+    return {
+        "action": "list_connectors",
+        "message": "Available exchange connectors:",
+        "connectors": connector_names,
+        "total_connectors": len(connector_names),
+        "current_accounts": current_accounts_str.strip(", "),
+        "next_step": "Call again with 'connector' parameter to see required credentials for a specific exchange",
+        "example": "Use connector='binance' to see Binance setup requirements",
+    }
+
+
 async def setup_connector(client: Any, request: SetupConnectorRequest) -> dict[str, Any]:
     """Setup or delete an exchange connector with credentials using progressive disclosure.
 
@@ -45,15 +124,11 @@ async def setup_connector(client: Any, request: SetupConnectorRequest) -> dict[s
     if flow_stage == "delete_list":
         # List all accounts and their configured connectors
         accounts = await client.accounts.list_accounts()
-        credentials_tasks = [
-            client.accounts.list_account_credentials(account_name=account_name)
-            for account_name in accounts
-        ]
-        credentials = await asyncio.gather(*credentials_tasks)
+        credentials = await asyncio.gather(
+            *(_get_account_credentials(client, account_name) for account_name in accounts)
+        )
 
-        account_connectors = {}
-        for account, creds in zip(accounts, credentials):
-            account_connectors[account] = creds if creds else []
+        account_connectors = {account: sorted(creds) for account, creds in zip(accounts, credentials)}
 
         return {
             "action": "delete_list",
@@ -64,18 +139,16 @@ async def setup_connector(client: Any, request: SetupConnectorRequest) -> dict[s
         }
 
     elif flow_stage == "delete_select_account":
-        # Show which accounts have this connector configured
+        # Show which accounts have this connector configured. The cached credential sets give O(1)
+        # membership checks and are reused by the delete step that follows.
         accounts = await client.accounts.list_accounts()
-        credentials_tasks = [
-            client.accounts.list_account_credentials(account_name=account_name)
-            for account_name in accounts
-        ]
-        credentials = await asyncio.gather(*credentials_tasks)
+        credentials = await asyncio.gather(
+            *(_get_account_credentials(client, account_name) for account_name in accounts)
+        )
 
-        matching_accounts = []
-        for account, creds in zip(accounts, credentials):
-            if request.connector in (creds or []):
-                matching_accounts.append(account)
+        matching_accounts = [
+            account for account, creds in zip(accounts, credentials) if request.connector in creds
+        ]
 
         if not matching_accounts:
             return {
@@ -90,7 +163,7 @@ async def setup_connector(client: Any, request: SetupConnectorRequest) -> dict[s
             "message": f"Connector '{request.connector}' is configured on the following accounts:",
             "connector": request.connector,
             "accounts": matching_accounts,
-            "default_account": settings.default_account,
+            "default_account": get_settings().default_account,
             "next_step": "Call again with 'account' to specify which account to delete from",
             "example": f"Use action='delete', connector='{request.connector}', "
                        f"account='{matching_accounts[0]}' to delete",
@@ -116,6 +189,7 @@ async def setup_connector(client: Any, request: SetupConnectorRequest) -> dict[s
                 account_name=account_name,
                 connector_name=request.connector,
             )
+            _invalidate_account_credentials(account_name)
 
             return {
                 "action": "credentials_deleted",
@@ -133,63 +207,39 @@ async def setup_connector(client: Any, request: SetupConnectorRequest) -> dict[s
 
     elif flow_stage == "select_account":
         # Step 2.5: List available accounts for selection (after connector and credentials are provided)
-        accounts = await client.accounts.list_accounts()
+        default_account = get_settings().default_account
+        # Warm the credentials cache for the default account so the connect step can skip the request
+        accounts, _ = await asyncio.gather(
+            client.accounts.list_accounts(),
+            _check_existing_connector(client, default_account, request.connector),
+        )
 
         return {
             "action": "select_account",
             "message": f"Ready to connect {request.connector}. Please select an account:",
             "connector": request.connector,
             "accounts": accounts,
-            "default_account": settings.default_account,
+            "default_account": default_account,
             "next_step": "Call again with 'account' parameter to specify which account to use",
-            "example": f"Use account='{settings.default_account}' to use the default account, or choose from "
+            "example": f"Use account='{default_account}' to use the default account, or choose from "
             f"the available accounts above",
         }
 
     elif flow_stage == "list_exchanges":
         # Step 1: List available connectors
-        connectors = await client.connectors.list_connectors()
-
-        # Handle both string and object responses from the API
-        connector_names = []
-        for c in connectors:
-            if isinstance(c, str):
-                connector_names.append(c)
-            elif hasattr(c, "name"):
-                connector_names.append(c.name)
-            else:
-                connector_names.append(str(c))
-        current_accounts_str = "Current accounts: "
-        accounts = await client.accounts.list_accounts()
-        credentials_tasks = [client.accounts.list_account_credentials(account_name=account_name) for account_name in accounts]
-        credentials = await asyncio.gather(*credentials_tasks)
-        for account, creds in zip(accounts, credentials):
-            current_accounts_str += f"{account}: {creds}), "
-
-        return {
-            "action": "list_connectors",
-            "message": "Available exchange connectors:",
-            "connectors": connector_names,
-            "total_connectors": len(connector_names),
-            "current_accounts": current_accounts_str.strip(", "),
-            "next_step": "Call again with 'connector' parameter to see required credentials for a specific exchange",
-            "example": "Use connector='binance' to see Binance setup requirements",
-        }
+        return await list_available_connectors(client)
 
     elif flow_stage == "show_config":
         # Step 2: Show required credential fields for the connector
         try:
-            config_fields = await client.connectors.get_config_map(request.connector)
-
-            # Build a dictionary from the list of field names
-            credentials_dict = {field: f"your_{field}" for field in config_fields}
+            config_fields, example = await _get_config_map(client, request.connector)
 
             return {
                 "action": "show_config_map",
                 "connector": request.connector,
                 "required_fields": config_fields,
                 "next_step": "Call again with 'credentials' parameter containing the required fields",
-                "example": f"Use credentials={credentials_dict} to connect",
+                "example": example,
             }
         except Exception as e:
             raise ToolError(f"Failed to get configuration for connector '{request.connector}': {str(e)}")
@@ -197,54 +247,53 @@ async def setup_connector(client: Any, request: SetupConnectorRequest) -> dict[s
     elif flow_stage == "connect":
         # Step 3: Actually connect the exchange with provided credentials
         account_name = request.get_account_name()
+        connector = request.connector
 
         # Check if connector already exists
-        connector_exists = await _check_existing_connector(client, account_name, request.connector)
-
-        if connector_exists and request.requires_override_confirmation():
-            return {
-                "action": "requires_confirmation",
-                "message": f"WARNING: Connector '{request.connector}' already exists for account '{account_name}'",
-                "account": account_name,
-                "connector": request.connector,
-                "warning": "Adding credentials will override the existing connector configuration",
-                "next_step": "To proceed with overriding, add 'confirm_override': true to your request",
-                "example": "Use confirm_override=true along with your credentials to override the existing connector",
-            }
+        connector_exists = await _check_existing_connector(client, account_name, connector)
 
         if connector_exists and not request.confirm_override:
+            if request.requires_override_confirmation():
+                return {
+                    "action": "requires_confirmation",
+                    "message": f"WARNING: Connector '{connector}' already exists for account '{account_name}'",
+                    "account": account_name,
+                    "connector": connector,
+                    "warning": "Adding credentials will override the existing connector configuration",
+                    "next_step": "To proceed with overriding, add 'confirm_override': true to your request",
+                    "example": "Use confirm_override=true along with your credentials to override the existing connector",
+                }
             return {
                 "action": "override_rejected",
-                "message": f"Cannot override existing connector {request.connector} without explicit confirmation",
+                "message": f"Cannot override existing connector {connector} without explicit confirmation",
                 "account": account_name,
-                "connector": request.connector,
+                "connector": connector,
                 "next_step": "Set confirm_override=true to override the existing connector",
             }
 
         # Remove force_override from credentials before sending to API
-        credentials_to_send = dict(request.credentials)
-        if "force_override" in credentials_to_send:
-            del credentials_to_send["force_override"]
+        credentials_to_send = {k: v for k, v in request.credentials.items() if k != "force_override"}
 
         try:
             await client.accounts.add_credential(
-                account_name=account_name, connector_name=request.connector, credentials=credentials_to_send
+                account_name=account_name, connector_name=connector, credentials=credentials_to_send
             )
+            _invalidate_account_credentials(account_name)
 
             action_type = "credentials_overridden" if connector_exists else "credentials_added"
             message_action = "overridden" if connector_exists else "connected"
 
             return {
                 "action": action_type,
-                "message": f"Successfully {message_action} {request.connector} exchange to account {account_name}",
+                "message": f"Successfully {message_action} {connector} exchange to account {account_name}",
                 "account": account_name,
-                "connector": request.connector,
+                "connector": connector,
                 "credentials_count": len(credentials_to_send),
                 "was_existing": connector_exists,
                 "next_step": "Exchange is now ready for trading. Use get_account_state to verify the connection.",
             }
         except Exception as e:
-            raise ToolError(f"Failed to add credentials for {request.connector}: {str(e)}")
+            raise ToolError(f"Failed to add credentials for {connector}: {str(e)}")
 
     else:
         raise ToolError(f"Unknown flow stage: {flow_stage}")
@@ -93,7 +93,7 @@ async def get_bot_logs(
     logs = []
 
     # Collect error logs if requested
-    if log_type in ["error", "all"] and "error_logs" in bot_data:
+    if log_type in {"error", "all"} and "error_logs" in bot_data:
         error_logs = bot_data["error_logs"]
         for log_entry in error_logs:
             if search_term is None or search_term.lower() in log_entry.get("msg", "").lower():
@@ -101,7 +101,7 @@ async def get_bot_logs(
                 logs.append(log_entry)
 
     # Collect general logs if requested
-    if log_type in ["general", "all"] and "general_logs" in bot_data:
+    if log_type in {"general", "all"} and "general_logs" in bot_data:
         general_logs = bot_data["general_logs"]
         for log_entry in general_logs:
             if search_term is None or search_term.lower() in log_entry.get("msg", "").lower():
@@ -125,6 +125,34 @@ async def get_bot_logs(
     }
 
 
+async def _set_kill_switch(
+    client: Any, bot_name: str, controller_names: list[str], kill: bool
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """Set manual_kill_switch on each controller concurrently.
+
+    Returns the update result for each controller that succeeded and the error message for each
+    controller that failed. If every update fails, the first error is raised.
+    """
+    tasks = [
+        client.controllers.update_bot_controller_config(bot_name, controller, {"manual_kill_switch": kill})
+        for controller in controller_names
+    ]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    succeeded = {name: r for name, r in zip(controller_names, results) if not isinstance(r, Exception)}
+    failed = {name: str(r) for name, r in zip(controller_names, results) if isinstance(r, Exception)}
+    if not succeeded:
+        raise next(r for r in results if isinstance(r, Exception))
+    return succeeded, failed
+
+
+def _format_failed_controllers(failed: dict[str, str]) -> str:
+    """Describe controllers whose update failed, for appending to a result message"""
+    if not failed:
+        return ""
+    return "\nFailed: " + ", ".join(f"{name} ({error})" for name, error in failed.items())
+
+
 async def manage_bot_execution(
     client: Any,
     bot_name: str,
@@ -159,36 +187,30 @@ async def manage_bot_execution(
         if controller_names is None or len(controller_names) == 0:
             raise ValueError("controller_names is required for stop_controllers action")
 
-        tasks = [
-            client.controllers.update_bot_controller_config(bot_name, controller, {"manual_kill_switch": True})
-            for controller in controller_names
-        ]
-        result = await asyncio.gather(*tasks)
+        result, failed = await _set_kill_switch(client, bot_name, controller_names, True)
 
         return {
             "action": "stop_controllers",
             "bot_name": bot_name,
             "controller_names": controller_names,
             "result": result,
-            "message": f"Controllers stopped: {result}",
+            "failed": failed,
+            "message": f"Controllers stopped: {result}" + _format_failed_controllers(failed),
         }
 
     elif action == "start_controllers":
         if controller_names is None or len(controller_names) == 0:
             raise ValueError("controller_names is required for start_controllers action")
 
-        tasks = [
-            client.controllers.update_bot_controller_config(bot_name, controller, {"manual_kill_switch": False})
-            for controller in controller_names
-        ]
-        result = await asyncio.gather(*tasks)
+        result, failed = await _set_kill_switch(client, bot_name, controller_names, False)
 
         return {
             "action": "start_controllers",
             "bot_name": bot_name,
             "controller_names": controller_names,
             "result": result,
-            "message": f"Controllers started: {result}",
+            "failed": failed,
+            "message": f"Controllers started: {result}" + _format_failed_controllers(failed),
         }
 
     else:
@@ -4,8 +4,13 @@ Controller management operations business logic.
 This module provides the core business logic for managing controllers and their
 configurations, including exploration, modification, and bot deployment.
 """
+import asyncio
 from typing import Any, Literal
 
+# Deployments in flight, keyed by bot name and stored with their arguments, so repeated identical
+# deploy requests share one deployment
+_INFLIGHT_DEPLOYS: dict[str, tuple[tuple, asyncio.Task]] = {}
+
 
 async def manage_controllers(
     client: Any,
@@ -77,17 +82,24 @@ async def explore_controllers(
         Dictionary containing exploration results and formatted output
     """
     # List all controllers and their configs
-    controllers = await client.controllers.list_controllers()
-    configs = await client.controllers.list_controller_configs()
+    controllers, configs = await asyncio.gather(
+        client.controllers.list_controllers(),
+        client.controllers.list_controller_configs(),
+    )
 
     if action == "list":
+        # Group configs by controller once instead of rescanning them for every controller
+        configs_by_controller: dict[str, list[dict[str, Any]]] = {}
+        for c in configs:
+            configs_by_controller.setdefault(c.get('controller_name'), []).append(c)
+
         result = "Available Controllers:\n\n"
         for c_type, controller_list in controllers.items():
             if controller_type is not None and c_type != controller_type:
                 continue
             result += f"Controller Type: {c_type}\n"
             for controller in controller_list:
-                controller_configs = [c for c in configs if c.get('controller_name') == controller]
+                controller_configs = configs_by_controller.get(controller, [])
                 result += f"- {controller} ({len(controller_configs)} configs)\n"
                 if len(controller_configs) > 0:
                     for config in controller_configs:
@@ -157,7 +169,7 @@ async def explore_controllers(
         result += "-" * 80 + "\n"
 
         for param_name, param_info in template.items():
-            if param_name in ['id', 'controller_name', 'controller_type', 'candles_config', 'initial_positions']:
+            if param_name in {"id", "controller_name", "controller_type", "candles_config", "initial_positions"}:
                 continue  # Skip internal fields
 
             param_type = str(param_info.get('type', 'unknown'))
@@ -206,6 +218,158 @@ async def explore_controllers(
         }
 
 
+async def _upsert_controller(
+    client: Any,
+    controller_type: str | None,
+    controller_name: str | None,
+    controller_code: str | None,
+    config_name: str | None,
+    config_data: dict[str, Any] | None,
+    confirm_override: bool,
+) -> dict[str, Any]:
+    if not controller_type or not controller_name or not controller_code:
+        raise ValueError("controller_type, controller_name, and controller_code are required for controller upsert")
+
+    # Check if controller exists
+    controllers = await client.controllers.list_controllers()
+    exists = controller_name in controllers.get(controller_type, [])
+
+    if exists and not confirm_override:
+        existing_code = await client.controllers.get_controller(controller_type, controller_name)
+        return {
+            "action": "upsert",
+            "target": "controller",
+            "exists": True,
+            "controller_name": controller_name,
+            "controller_type": controller_type,
+            "current_code": existing_code,
+            "message": (f"Controller '{controller_name}' already exists and this is the current code: {existing_code}. "
+                       f"Set confirm_override=True to update it."),
+        }
+
+    result = await client.controllers.create_or_update_controller(
+        controller_type, controller_name, controller_code
+    )
+
+    return {
+        "action": "upsert",
+        "target": "controller",
+        "exists": exists,
+        "controller_name": controller_name,
+        "controller_type": controller_type,
+        "result": result,
+        "message": f"Controller {'updated' if exists else 'created'}: {result}",
+    }
+
+
+async def _delete_controller(
+    client: Any,
+    controller_type: str | None,
+    controller_name: str | None,
+    controller_code: str | None,
+    config_name: str | None,
+    config_data: dict[str, Any] | None,
+    confirm_override: bool,
+) -> dict[str, Any]:
+    if not controller_type or not controller_name:
+        raise ValueError("controller_type and controller_name are required for controller delete")
+
+    result = await client.controllers.delete_controller(controller_type, controller_name)
+
+    return {
+        "action": "delete",
+        "target": "controller",
+        "controller_name": controller_name,
+        "controller_type": controller_type,
+        "result": result,
+        "message": f"Controller deleted: {result}",
+    }
+
+
+async def _upsert_config(
+    client: Any,
+    controller_type: str | None,
+    controller_name: str | None,
+    controller_code: str | None,
+    config_name: str | None,
+    config_data: dict[str, Any] | None,
+    confirm_override: bool,
+) -> dict[str, Any]:
+    if not config_name or not config_data:
+        raise ValueError("config_name and config_data are required for config upsert")
+
+    # Extract controller_type and controller_name from config_data
+    config_controller_type = config_data.get("controller_type")
+    config_controller_name = config_data.get("controller_name")
+
+    if not config_controller_type or not config_controller_name:
+        raise ValueError("config_data must include 'controller_type' and 'controller_name'")
+
+    # Validate config first
+    await client.controllers.validate_controller_config(config_controller_type, config_controller_name, config_data)
+
+    # Modifying saved/global config (design-time only)
+    if "id" not in config_data or config_data["id"] != config_name:
+        config_data["id"] = config_name
+
+    controller_configs = await client.controllers.list_controller_configs()
+    exists = any(c.get("id") == config_name for c in controller_configs)
+
+    if exists and not confirm_override:
+        existing_config = await client.controllers.get_controller_config(config_name)
+        return {
+            "action": "upsert",
+            "target": "config",
+            "exists": True,
+            "config_name": config_name,
+            "current_config": existing_config,
+            "message": (f"Config '{config_name}' already exists with data: {existing_config}. "
+                       "Set confirm_override=True to update it."),
+        }
+
+    result = await client.controllers.create_or_update_controller_config(config_name, config_data)
+    return {
+        "action": "upsert",
+        "target": "config",
+        "exists": exists,
+        "config_name": config_name,
+        "result": result,
+        "message": f"Config {'updated' if exists else 'created'}: {result}",
+    }
+
+
+async def _delete_config(
+    client: Any,
+    controller_type: str | None,
+    controller_name: str | None,
+    controller_code: str | None,
+    config_name: str | None,
+    config_data: dict[str, Any] | None,
+    confirm_override: bool,
+) -> dict[str, Any]:
+    if not config_name:
+        raise ValueError("config_name is required for config delete")
+
+    result = await client.controllers.delete_controller_config(config_name)
+
+    return {
+        "action": "delete",
+        "target": "config",
+        "config_name": config_name,
+        "result": result,
+        "message": f"Config deleted: {result}",
+    }
+
+
+# (target, action) -> handler, built once at import
+_MODIFY_HANDLERS = {
+    ("controller", "upsert"): _upsert_controller,
+    ("controller", "delete"): _delete_controller,
+    ("config", "upsert"): _upsert_config,
+    ("config", "delete"): _delete_config,
+}
+
+
 async def modify_controllers(
     client: Any,
     action: Literal["upsert", "delete"],
@@ -239,118 +403,21 @@ async def modify_controllers(
     Raises:
         ValueError: If required parameters are missing or invalid
     """
-    if target == "controller":
-        if action == "upsert":
-            if not controller_type or not controller_name or not controller_code:
-                raise ValueError("controller_type, controller_name, and controller_code are required for controller upsert")
-
-            # Check if controller exists
-            controllers = await client.controllers.list_controllers()
-            exists = controller_name in controllers.get(controller_type, [])
-
-            if exists and not confirm_override:
-                existing_code = await client.controllers.get_controller(controller_type, controller_name)
-                return {
-                    "action": "upsert",
-                    "target": "controller",
-                    "exists": True,
-                    "controller_name": controller_name,
-                    "controller_type": controller_type,
-                    "current_code": existing_code,
-                    "message": (f"Controller '{controller_name}' already exists and this is the current code: {existing_code}. "
-                               f"Set confirm_override=True to update it."),
-                }
-
-            result = await client.controllers.create_or_update_controller(
-                controller_type, controller_name, controller_code
-            )
-
-            return {
-                "action": "upsert",
-                "target": "controller",
-                "exists": exists,
-                "controller_name": controller_name,
-                "controller_type": controller_type,
-                "result": result,
-                "message": f"Controller {'updated' if exists else 'created'}: {result}",
-            }
-
-        elif action == "delete":
-            if not controller_type or not controller_name:
-                raise ValueError("controller_type and controller_name are required for controller delete")
-
-            result = await client.controllers.delete_controller(controller_type, controller_name)
-
-            return {
-                "action": "delete",
-                "target": "controller",
-                "controller_name": controller_name,
-                "controller_type": controller_type,
-                "result": result,
-                "message": f"Controller deleted: {result}",
-            }
-
-    elif target == "config":
-        if action == "upsert":
-            if not config_name or not config_data:
-                raise ValueError("config_name and config_data are required for config upsert")
-
-            # Extract controller_type and controller_name from config_data
-            config_controller_type = config_data.get("controller_type")
-            config_controller_name = config_data.get("controller_name")
-
-            if not config_controller_type or not config_controller_name:
-                raise ValueError("config_data must include 'controller_type' and 'controller_name'")
-
-            # Validate config first
-            await client.controllers.validate_controller_config(config_controller_type, config_controller_name, config_data)
-
-            # Modifying saved/global config (design-time only)
-            if "id" not in config_data or config_data["id"] != config_name:
-                config_data["id"] = config_name
-
-            controller_configs = await client.controllers.list_controller_configs()
-            exists = config_name in [c.get("id") for c in controller_configs]
-
-            if exists and not confirm_override:
-                existing_config = await client.controllers.get_controller_config(config_name)
-                return {
-                    "action": "upsert",
-                    "target": "config",
-                    "exists": True,
-                    "config_name": config_name,
-                    "current_config": existing_config,
-                    "message": (f"Config '{config_name}' already exists with data: {existing_config}. "
-                               "Set confirm_override=True to update it."),
-                }
-
-            result = await client.controllers.create_or_update_controller_config(config_name, config_data)
-            return {
-                "action": "upsert",
-                "target": "config",
-                "exists": exists,
-                "config_name": config_name,
-                "result": result,
-                "message": f"Config {'updated' if exists else 'created'}: {result}",
-            }
-
-        elif action == "delete":
-            if not config_name:
-                raise ValueError("config_name is required for config delete")
-
-            result = await client.controllers.delete_controller_config(config_name)
-            await client.bot_orchestration.deploy_v2_controllers()
-
-            return {
-                "action": "delete",
-                "target": "config",
-                "config_name": config_name,
-                "result": result,
-                "message": f"Config deleted: {result}",
-            }
-
-    else:
-        raise ValueError("Invalid target. Must be 'controller' or 'config'.")
+    handler = _MODIFY_HANDLERS.get((target, action))
+    if handler is None:
+        if target not in ("controller", "config"):
+            raise ValueError("Invalid target. Must be 'controller' or 'config'.")
+        raise ValueError(f"Invalid action '{action}'. Use 'upsert' or 'delete'.")
+
+    return await handler(
+        client,
+        controller_type=controller_type,
+        controller_name=controller_name,
+        controller_code=controller_code,
+        config_name=config_name,
+        config_data=config_data,
+        confirm_override=confirm_override,
+    )
 
 
 async def deploy_bot(
@@ -377,14 +444,28 @@ async def deploy_bot(
     Returns:
         Dictionary containing deployment results
     """
-    result = await client.bot_orchestration.deploy_v2_controllers(
-        instance_name=bot_name,
-        controllers_config=controllers_config,
-        credentials_profile=account_name,
-        max_global_drawdown_quote=max_global_drawdown_quote,
-        max_controller_drawdown_quote=max_controller_drawdown_quote,
-        image=image,
+    deploy_args = (
+        tuple(controllers_config), account_name, image, max_global_drawdown_quote, max_controller_drawdown_quote
     )
+    inflight = _INFLIGHT_DEPLOYS.get(bot_name)
+    if inflight is not None:
+        inflight_args, task = inflight
+        if inflight_args != deploy_args:
+            raise ValueError(f"Deployment for '{bot_name}' already in progress")
+    else:
+        task = asyncio.create_task(client.bot_orchestration.deploy_v2_controllers(
+            instance_name=bot_name,
+            controllers_config=controllers_config,
+            credentials_profile=account_name,
+            max_global_drawdown_quote=max_global_drawdown_quote,
+            max_controller_drawdown_quote=max_controller_drawdown_quote,
+            image=image,
+        ))
+        _INFLIGHT_DEPLOYS[bot_name] = (deploy_args, task)
+        task.add_done_callback(lambda _: _INFLIGHT_DEPLOYS.pop(bot_name, None))
+
+    # Shield so a cancelled caller doesn't abort a deployment another caller is waiting on
+    result = await asyncio.shield(task)
 
     return {
         "bot_name": bot_name,
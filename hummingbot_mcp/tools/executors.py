@@ -7,8 +7,10 @@ creation, viewing, stopping, and position management with progressive disclosure
 import logging
 from typing import Any
 
+from hummingbot_mcp.cache import TTLCache
 from hummingbot_mcp.executor_preferences import executor_preferences
 from hummingbot_mcp.formatters.executors import (
+    INTERNAL_EXECUTOR_FIELDS,
     format_executor_detail,
     format_executor_schema_table,
     format_executors_table,
@@ -19,8 +21,19 @@ from hummingbot_mcp.schemas import ManageExecutorsRequest
 
 logger = logging.getLogger("hummingbot-mcp")
 
-# Internal fields injected by the MCP layer, not user-supplied
-_INTERNAL_FIELDS = {"type", "executor_type", "id"}
+# Executor config schemas only change with backend releases, so they are cached per executor type
+SCHEMA_TTL = 300.0
+_SCHEMA_CACHE: TTLCache[dict[str, Any]] = TTLCache(SCHEMA_TTL)
+
+
+async def _get_executor_schema(client: Any, executor_type: str) -> dict[str, Any]:
+    """Return the config schema for an executor type, cached per type.
+
+    Concurrent lookups for the same type share one request.
+    """
+    return await _SCHEMA_CACHE.get(
+        executor_type, lambda: client.executors.get_executor_config_schema(executor_type)
+    )
 
 
 def validate_executor_config(config: dict[str, Any], schema: dict[str, Any]) -> list[str]:
@@ -39,13 +52,16 @@ def _validate_level(config: dict[str, Any], schema: dict[str, Any], path: str, e
     if not properties:
         return
 
-    allowed = set(properties.keys())
+    # The properties dict is already a hash index of the allowed keys; the sorted field list is
+    # only needed for error messages, so it is built once and only when a key is rejected
+    field_list = None
 
     for key in config:
-        if not path and key in _INTERNAL_FIELDS:
+        if not path and key in INTERNAL_EXECUTOR_FIELDS:
             continue
-        if key not in allowed:
-            field_list = ", ".join(sorted(allowed - _INTERNAL_FIELDS))
+        if key not in properties:
+            if field_list is None:
+                field_list = ", ".join(sorted(properties.keys() - INTERNAL_EXECUTOR_FIELDS))
             location = f" inside '{path}'" if path else ""
             errors.append(f"Unknown field '{key}'{location}. Allowed fields: {field_list}")
             continue
@@ -90,7 +106,7 @@ async def manage_executors(client: Any, request: ManageExecutorsRequest) -> dict
     elif flow_stage == "show_schema":
         # Stage 2: Show config schema with user defaults
         try:
-            schema = await client.executors.get_executor_config_schema(request.executor_type)
+            schema = await _get_executor_schema(client, request.executor_type)
         except Exception as e:
             return {
                 "action": "show_schema",
@@ -146,7 +162,7 @@ async def manage_executors(client: Any, request: ManageExecutorsRequest) -> dict
 
         # Validate config fields against backend schema before sending
         try:
-            schema = await client.executors.get_executor_config_schema(executor_type)
+            schema = await _get_executor_schema(client, executor_type)
             validation_errors = validate_executor_config(merged_config, schema)
             if validation_errors:
                 error_list = "\n".join(f"  - {e}" for e in validation_errors)
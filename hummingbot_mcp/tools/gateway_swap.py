@@ -150,7 +150,7 @@ async def manage_gateway_swaps(client: Any, request: GatewaySwapRequest) -> dict
 
         return {
             "action": "search",
-            "filters": {k: v for k, v in search_params.items() if k not in ["limit", "offset"]},
+            "filters": {k: v for k, v in search_params.items() if k not in {"limit", "offset"}},
             "pagination": {
                 "limit": search_params["limit"],
                 "offset": search_params["offset"]
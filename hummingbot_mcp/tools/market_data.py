@@ -7,12 +7,30 @@ prices, candles, funding rates, and order books.
 from datetime import datetime
 from typing import Any, Literal
 
+from hummingbot_mcp.cache import TTLCache
 from hummingbot_mcp.formatters import (
     format_candles_as_table,
     format_order_book_as_table,
     format_prices_as_table,
 )
 
+# The set of candle-capable connectors rarely changes, so it is cached for a few
+# minutes instead of being fetched on every get_candles call.
+CANDLE_CONNECTORS_TTL = 300.0
+_CANDLE_CONNECTORS_CACHE: TTLCache[set[str]] = TTLCache(CANDLE_CONNECTORS_TTL)
+
+# Upper bound on candles returned to the LLM; larger fetches are aggregated into buckets
+MAX_CANDLE_ROWS = 2000
+
+
+async def get_candle_connectors(client: Any) -> set[str]:
+    """Return the set of connectors that support candles, refreshing it once per TTL."""
+
+    async def fetch() -> set[str]:
+        return set(await client.market_data.get_available_candle_connectors())
+
+    return await _CANDLE_CONNECTORS_CACHE.get(None, fetch)
+
 
 async def get_prices(
     client: Any, connector_name: str, trading_pairs: list[str]
@@ -50,12 +68,31 @@ async def get_prices(
     }
 
 
+def _downsample_candles(candles: list[dict[str, Any]], bucket_size: int) -> list[dict[str, Any]]:
+    """Aggregate every bucket_size consecutive candles into one OHLCV candle."""
+    aggregated = []
+    for start in range(0, len(candles), bucket_size):
+        bucket = candles[start:start + bucket_size]
+        highs = [float(c["high"]) for c in bucket if c.get("high") is not None]
+        lows = [float(c["low"]) for c in bucket if c.get("low") is not None]
+        aggregated.append({
+            "timestamp": bucket[0].get("timestamp"),
+            "open": bucket[0].get("open"),
+            "high": max(highs) if highs else None,
+            "low": min(lows) if lows else None,
+            "close": bucket[-1].get("close"),
+            "volume": sum(float(c.get("volume") or 0) for c in bucket),
+        })
+    return aggregated
+
+
 async def get_candles(
     client: Any,
     connector_name: str,
     trading_pair: str,
     interval: str = "1h",
     days: int = 30,
+    max_rows: int = MAX_CANDLE_ROWS,
 ) -> dict[str, Any]:
     """
     Get candle data for a trading pair.
@@ -66,19 +103,24 @@ async def get_candles(
         trading_pair: Trading pair
         interval: Candle interval (e.g., '1h', '5m', '1d')
         days: Number of days of historical data
+        max_rows: Maximum candles to return; larger results are aggregated into OHLCV buckets
 
     Returns:
-        Dictionary containing candles data and formatted table
+        Dictionary containing candles data and formatted table. "bucket_interval" is the
+        interval each returned row covers, which differs from "interval" after aggregation.
 
     Raises:
-        ValueError: If connector doesn't support candles or interval is invalid
+        ValueError: If connector doesn't support candles, interval is invalid or max_rows is not positive
     """
+    if max_rows < 1:
+        raise ValueError("max_rows must be a positive integer")
+
     # Check if connector supports candle data
-    available_connectors = await client.market_data.get_available_candle_connectors()
+    available_connectors = await get_candle_connectors(client)
     if connector_name not in available_connectors:
         raise ValueError(
             f"Connector '{connector_name}' does not support candle data. "
-            f"Available connectors: {available_connectors}"
+            f"Available connectors: {sorted(available_connectors)}"
         )
 
     # Calculate max records based on interval
@@ -109,6 +151,14 @@ async def get_candles(
         max_records=max_records,
     )
 
+    # Aggregate oversized results so the response stays small enough for the LLM
+    fetched_candles = len(candles)
+    bucket_interval = interval
+    if fetched_candles > max_rows:
+        bucket_size = -(-fetched_candles // max_rows)  # ceil division
+        candles = _downsample_candles(candles, bucket_size)
+        bucket_interval = f"{int(interval_num or 1) * bucket_size}{interval[-1]}"
+
     # Format candles as table
     candles_table = format_candles_as_table(candles)
 
@@ -118,7 +168,9 @@ async def get_candles(
         "connector_name": connector_name,
         "trading_pair": trading_pair,
         "interval": interval,
+        "bucket_interval": bucket_interval,
         "total_candles": len(candles),
+        "fetched_candles": fetched_candles,
     }
 
 
@@ -10,7 +10,6 @@ import asyncio
 import logging
 from typing import Any, Literal
 
-from hummingbot_mcp.exceptions import ToolError
 from hummingbot_mcp.hummingbot_client import HummingbotClient
 from hummingbot_mcp.formatters import format_portfolio_as_table
 from hummingbot_mcp.tools import trading as trading_tools
@@ -18,6 +17,14 @@ from hummingbot_mcp.tools import trading as trading_tools
 logger = logging.getLogger("hummingbot-mcp")
 
 
+def _format_price(value: Any) -> Any:
+    """Format a numeric price to 4 decimals, returning the value unchanged if it isn't numeric"""
+    try:
+        return f"{float(value):.4f}"
+    except (TypeError, ValueError):
+        return value
+
+
 async def get_portfolio_overview(
     client: HummingbotClient,
     account_names: list[str] | None = None,
@@ -55,365 +62,356 @@ async def get_portfolio_overview(
     Returns:
         Dictionary containing formatted portfolio data with sections for each type
     """
-    try:
-        # Prepare tasks for parallel execution
-        tasks = []
-        task_names = []
-
-        # Task 1: Get token balances
-        if include_balances:
-            async def get_balances():
-                try:
-                    return await client.portfolio.get_state(
-                        account_names=account_names,
-                        connector_names=connector_names,
-                        refresh=refresh,
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to get balances: {str(e)}")
-                    return None
-
-            tasks.append(get_balances())
-            task_names.append("balances")
-
-        # Task 2: Get perpetual positions
-        if include_perp_positions:
-            async def get_perp_positions():
-                try:
-                    return await trading_tools.get_positions(
-                        client=client,
-                        account_names=account_names,
-                        connector_names=connector_names,
-                        limit=1000,  # Get all positions
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to get perpetual positions: {str(e)}")
-                    return None
-
-            tasks.append(get_perp_positions())
-            task_names.append("perp_positions")
-
-        # Task 3: Get LP positions (CLMM) - Real-time from blockchain
-        if include_lp_positions:
-            async def get_lp_positions():
-                try:
-                    # Step 1: Get all unique pools from database (to know which pools to query)
-                    # This uses the backend database to find pools the user has interacted with
-                    search_result = await client.gateway_clmm.search_positions(
-                        limit=1000,
-                        offset=0,
-                        status="OPEN",  # Only get open positions
-                    )
-
-                    if not search_result or not isinstance(search_result, dict):
-                        return []
-
-                    db_positions = search_result.get("data", [])
-                    if not db_positions:
-                        return []
-
-                    # Step 2: Get unique pool addresses and their networks/connectors
-                    pools_map = {}  # {(connector, network, pool_address): True}
-                    for pos in db_positions:
-                        connector = pos.get("connector")
-                        network = pos.get("network")
-                        pool_address = pos.get("pool_address")
-                        if connector and network and pool_address:
-                            pools_map[(connector, network, pool_address)] = True
-
-                    # Step 3: Fetch real-time data for each pool
-                    real_time_positions = []
-                    for (connector, network, pool_address) in pools_map.keys():
-                        try:
-                            positions = await client.gateway_clmm.get_positions_owned(
-                                connector=connector,
-                                network=network,
-                                pool_address=pool_address,
-                                wallet_address=None  # Uses default wallet
-                            )
-
-                            if positions and isinstance(positions, list):
-                                # Add connector and network info to each position
-                                for pos in positions:
-                                    pos["connector"] = connector
-                                    pos["network"] = network
-                                real_time_positions.extend(positions)
-                        except Exception as e:
-                            logger.warning(f"Failed to get positions for pool {pool_address}: {str(e)}")
-                            continue
-
-                    return real_time_positions
-
-                except Exception as e:
-                    logger.warning(f"Failed to get LP positions: {str(e)}")
-                    return None
-
-            tasks.append(get_lp_positions())
-            task_names.append("lp_positions")
-
-        # Task 4: Get active orders
-        if include_active_orders:
-            async def get_active_orders():
-                try:
-                    return await trading_tools.search_orders(
-                        client=client,
-                        account_names=account_names,
-                        connector_names=connector_names,
-                        status="OPEN",  # Only get open orders
-                        limit=1000,  # Get all open orders
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to get active orders: {str(e)}")
-                    return None
-
-            tasks.append(get_active_orders())
-            task_names.append("active_orders")
-
-        # Execute all tasks in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=False)
-
-        # Map results back to their names
-        data = {}
-        for i, task_name in enumerate(task_names):
-            data[task_name] = results[i]
-
-        # Process and format each section
-        sections = []
-        total_value = 0.0
-
-        # ============================================
-        # SECTION 1: Token Balances
-        # ============================================
-        if include_balances and data.get("balances"):
-            balances_data = data["balances"]
-
-            # Calculate total value from balances
-            balance_value = 0.0
-            if balances_data and isinstance(balances_data, dict):
-                for account_name, connectors in balances_data.items():
-                    if not isinstance(connectors, dict):
+    # Prepare tasks for parallel execution
+    tasks = []
+    task_names = []
+
+    # Task 1: Get token balances
+    if include_balances:
+        async def get_balances():
+            try:
+                return await client.portfolio.get_state(
+                    account_names=account_names,
+                    connector_names=connector_names,
+                    refresh=refresh,
+                )
+            except Exception as e:
+                logger.warning("Failed to get balances: %s", e)
+                return None
+
+        tasks.append(get_balances())
+        task_names.append("balances")
+
+    # Task 2: Get perpetual positions
+    if include_perp_positions:
+        async def get_perp_positions():
+            try:
+                return await trading_tools.get_positions(
+                    client=client,
+                    account_names=account_names,
+                    connector_names=connector_names,
+                    limit=1000,  # Get all positions
+                )
+            except Exception as e:
+                logger.warning("Failed to get perpetual positions: %s", e)
+                return None
+
+        tasks.append(get_perp_positions())
+        task_names.append("perp_positions")
+
+    # Task 3: Get LP positions (CLMM) - Real-time from blockchain
+    if include_lp_positions:
+        async def get_lp_positions():
+            try:
+                # Step 1: Get all unique pools from database (to know which pools to query)
+                # This uses the backend database to find pools the user has interacted with
+                search_result = await client.gateway_clmm.search_positions(
+                    limit=1000,
+                    offset=0,
+                    status="OPEN",  # Only get open positions
+                )
+
+                if not search_result or not isinstance(search_result, dict):
+                    return []
+
+                db_positions = search_result.get("data", [])
+                if not db_positions:
+                    return []
+
+                # Step 2: Get unique pool addresses and their networks/connectors
+                pools_map = {}  # {(connector, network, pool_address): True}
+                for pos in db_positions:
+                    connector = pos.get("connector")
+                    network = pos.get("network")
+                    pool_address = pos.get("pool_address")
+                    if connector and network and pool_address:
+                        pools_map[(connector, network, pool_address)] = True
+
+                # Step 3: Fetch real-time data for all pools concurrently
+                pools = list(pools_map.keys())
+                pool_results = await asyncio.gather(
+                    *(
+                        client.gateway_clmm.get_positions_owned(
+                            connector=connector,
+                            network=network,
+                            pool_address=pool_address,
+                            wallet_address=None  # Uses default wallet
+                        )
+                        for connector, network, pool_address in pools
+                    ),
+                    return_exceptions=True,
+                )
+
+                real_time_positions = []
+                for (connector, network, pool_address), positions in zip(pools, pool_results):
+                    if isinstance(positions, Exception):
+                        logger.warning("Failed to get positions for pool %s: %s", pool_address, positions)
                         continue
-                    for connector_name, balances in connectors.items():
-                        if not isinstance(balances, list):
-                            continue
-                        for balance in balances:
-                            value = balance.get("value", 0)
-                            if value:
-                                balance_value += float(value)
-
-            total_value += balance_value
 
-            # Format balances as table
-            balances_table = format_portfolio_as_table(balances_data) if balances_data else "No balances found"
+                    if positions and isinstance(positions, list):
+                        # Add connector and network info to each position
+                        for pos in positions:
+                            pos["connector"] = connector
+                            pos["network"] = network
+                        real_time_positions.extend(positions)
+
+                return real_time_positions
+
+            except Exception as e:
+                logger.warning("Failed to get LP positions: %s", e)
+                return None
+
+        tasks.append(get_lp_positions())
+        task_names.append("lp_positions")
+
+    # Task 4: Get active orders
+    if include_active_orders:
+        async def get_active_orders():
+            try:
+                return await trading_tools.search_orders(
+                    client=client,
+                    account_names=account_names,
+                    connector_names=connector_names,
+                    status="OPEN",  # Only get open orders
+                    limit=1000,  # Get all open orders
+                )
+            except Exception as e:
+                logger.warning("Failed to get active orders: %s", e)
+                return None
+
+        tasks.append(get_active_orders())
+        task_names.append("active_orders")
+
+    # Execute all tasks in parallel
+    results = await asyncio.gather(*tasks, return_exceptions=False)
+
+    # Map results back to their names
+    data = dict(zip(task_names, results))
+
+    # Process and format each section
+    sections = []
+    total_value = 0.0
+
+    # ============================================
+    # SECTION 1: Token Balances
+    # ============================================
+    if include_balances and data.get("balances"):
+        balances_data = data["balances"]
+
+        # Calculate total value from balances
+        balance_value = 0.0
+        if balances_data and isinstance(balances_data, dict):
+            for account_name, connectors in balances_data.items():
+                if not isinstance(connectors, dict):
+                    continue
+                for connector_name, balances in connectors.items():
+                    if not isinstance(balances, list):
+                        continue
+                    for balance in balances:
+                        value = balance.get("value", 0)
+                        if value:
+                            balance_value += float(value)
+
+        total_value += balance_value
+
+        # Format balances as table
+        balances_table = format_portfolio_as_table(balances_data) if balances_data else "No balances found"
+
+        sections.append({
+            "title": "Token Balances",
+            "content": balances_table,
+            "total_value": balance_value,
+            "emoji": "💰"
+        })
+    elif include_balances and not data.get("balances"):
+        sections.append({
+            "title": "Token Balances",
+            "content": "Failed to fetch balances",
+            "total_value": 0.0,
+            "emoji": "⚠️"
+        })
+
+    # ============================================
+    # SECTION 2: Perpetual Positions
+    # ============================================
+    if include_perp_positions and data.get("perp_positions"):
+        perp_data = data["perp_positions"]
+
+        if perp_data and isinstance(perp_data, dict):
+            perp_table = perp_data.get("positions_table", "No positions found")
+            total_positions = perp_data.get("total_positions", 0)
+
+            # Calculate total PnL if available
+            # Note: You'll need to parse the table or enhance trading_tools.get_positions
+            # to return structured data with PnL values
 
             sections.append({
-                "title": "Token Balances",
-                "content": balances_table,
-                "total_value": balance_value,
-                "emoji": "💰"
-            })
-        elif include_balances and not data.get("balances"):
-            sections.append({
-                "title": "Token Balances",
-                "content": "Failed to fetch balances",
-                "total_value": 0.0,
-                "emoji": "⚠️"
+                "title": "Perpetual Positions",
+                "content": perp_table,
+                "total_positions": total_positions,
+                "emoji": "📊"
             })
-
-        # ============================================
-        # SECTION 2: Perpetual Positions
-        # ============================================
-        if include_perp_positions and data.get("perp_positions"):
-            perp_data = data["perp_positions"]
-
-            if perp_data and isinstance(perp_data, dict):
-                perp_table = perp_data.get("positions_table", "No positions found")
-                total_positions = perp_data.get("total_positions", 0)
-
-                # Calculate total PnL if available
-                # Note: You'll need to parse the table or enhance trading_tools.get_positions
-                # to return structured data with PnL values
-
-                sections.append({
-                    "title": "Perpetual Positions",
-                    "content": perp_table,
-                    "total_positions": total_positions,
-                    "emoji": "📊"
-                })
-            else:
-                sections.append({
-                    "title": "Perpetual Positions",
-                    "content": "No perpetual positions found",
-                    "total_positions": 0,
-                    "emoji": "📊"
-                })
-        elif include_perp_positions and not data.get("perp_positions"):
+        else:
             sections.append({
                 "title": "Perpetual Positions",
-                "content": "Failed to fetch perpetual positions",
+                "content": "No perpetual positions found",
                 "total_positions": 0,
-                "emoji": "⚠️"
+                "emoji": "📊"
             })
+    elif include_perp_positions and not data.get("perp_positions"):
+        sections.append({
+            "title": "Perpetual Positions",
+            "content": "Failed to fetch perpetual positions",
+            "total_positions": 0,
+            "emoji": "⚠️"
+        })
+
+    # ============================================
+    # SECTION 3: LP Positions (CLMM) - Real-time data
+    # ============================================
+    if include_lp_positions and data.get("lp_positions") is not None:
+        lp_positions = data["lp_positions"]
+
+        if lp_positions and isinstance(lp_positions, list):
+            total_lp_positions = len(lp_positions)
+
+            # All positions from get_positions() are OPEN by default
+            # (it only returns active positions from the blockchain)
+            open_positions = lp_positions
+
+            # Format LP positions - show all open positions with real-time data
+            if open_positions:
+                lp_table_lines = ["Status: OPEN positions", ""]
+                lp_table_lines.append("connector | trading_pair | lower_price | upper_price | position_address")
+                lp_table_lines.append("-" * 100)
+
+                for pos in open_positions[:10]:  # Show up to 10 open positions
+                    connector = pos.get("connector", "N/A")
+                    trading_pair = pos.get("trading_pair", "N/A")
+                    lower_price = pos.get("lower_price", "N/A")
+                    upper_price = pos.get("upper_price", "N/A")
+                    position_address = pos.get("position_address", "N/A")
+
+                    # Format prices
+                    lower_price = _format_price(lower_price)
+                    upper_price = _format_price(upper_price)
+
+                    # Truncate position address
+                    if position_address != "N/A" and len(position_address) > 20:
+                        position_address = f"{position_address[:8]}...{position_address[-6:]}"
+
+                    lp_table_lines.append(
+                        f"{connector[:10]:10} | {trading_pair[:15]:15} | {str(lower_price)[:11]:11} | {str(upper_price)[:11]:11} | {position_address}"
+                    )
 
-        # ============================================
-        # SECTION 3: LP Positions (CLMM) - Real-time data
-        # ============================================
-        if include_lp_positions and data.get("lp_positions") is not None:
-            lp_positions = data["lp_positions"]
-
-            if lp_positions and isinstance(lp_positions, list):
-                total_lp_positions = len(lp_positions)
-
-                # All positions from get_positions() are OPEN by default
-                # (it only returns active positions from the blockchain)
-                open_positions = lp_positions
-
-                # Format LP positions - show all open positions with real-time data
-                if open_positions:
-                    lp_table_lines = ["Status: OPEN positions", ""]
-                    lp_table_lines.append("connector | trading_pair | lower_price | upper_price | position_address")
-                    lp_table_lines.append("-" * 100)
-
-                    for pos in open_positions[:10]:  # Show up to 10 open positions
-                        connector = pos.get("connector", "N/A")
-                        trading_pair = pos.get("trading_pair", "N/A")
-                        lower_price = pos.get("lower_price", "N/A")
-                        upper_price = pos.get("upper_price", "N/A")
-                        position_address = pos.get("position_address", "N/A")
-
-                        # Format prices
-                        if lower_price != "N/A" and isinstance(lower_price, (int, float, str)):
-                            try:
-                                lower_price = f"{float(lower_price):.4f}"
-                            except:
-                                pass
-
-                        if upper_price != "N/A" and isinstance(upper_price, (int, float, str)):
-                            try:
-                                upper_price = f"{float(upper_price):.4f}"
-                            except:
-                                pass
-
-                        # Truncate position address
-                        if position_address != "N/A" and len(position_address) > 20:
-                            position_address = f"{position_address[:8]}...{position_address[-6:]}"
-
-                        lp_table_lines.append(
-                            f"{connector[:10]:10} | {trading_pair[:15]:15} | {str(lower_price)[:11]:11} | {str(upper_price)[:11]:11} | {position_address}"
-                        )
-
-                    if len(open_positions) > 10:
-                        lp_table_lines.append(f"... and {len(open_positions) - 10} more open positions")
-
-                    lp_table = "\n".join(lp_table_lines)
-                else:
-                    lp_table = "No active LP positions found"
+                if len(open_positions) > 10:
+                    lp_table_lines.append(f"... and {len(open_positions) - 10} more open positions")
 
-                sections.append({
-                    "title": "LP Positions (CLMM)",
-                    "content": lp_table,
-                    "total_positions": total_lp_positions,
-                    "open_positions": len(open_positions),
-                    "emoji": "🏊"
-                })
+                lp_table = "\n".join(lp_table_lines)
             else:
-                sections.append({
-                    "title": "LP Positions (CLMM)",
-                    "content": "No LP positions found",
-                    "total_positions": 0,
-                    "emoji": "🏊"
-                })
-        elif include_lp_positions and not data.get("lp_positions"):
+                lp_table = "No active LP positions found"
+
             sections.append({
                 "title": "LP Positions (CLMM)",
-                "content": "Failed to fetch LP positions",
+                "content": lp_table,
+                "total_positions": total_lp_positions,
+                "open_positions": len(open_positions),
+                "emoji": "🏊"
+            })
+        else:
+            sections.append({
+                "title": "LP Positions (CLMM)",
+                "content": "No LP positions found",
                 "total_positions": 0,
-                "emoji": "⚠️"
+                "emoji": "🏊"
             })
+    elif include_lp_positions and not data.get("lp_positions"):
+        sections.append({
+            "title": "LP Positions (CLMM)",
+            "content": "Failed to fetch LP positions",
+            "total_positions": 0,
+            "emoji": "⚠️"
+        })
+
+    # ============================================
+    # SECTION 4: Active Orders
+    # ============================================
+    if include_active_orders and data.get("active_orders"):
+        orders_data = data["active_orders"]
+
+        if orders_data and isinstance(orders_data, dict):
+            orders_table = orders_data.get("orders_table", "No active orders found")
+            total_orders = orders_data.get("total_returned", 0)
 
-        # ============================================
-        # SECTION 4: Active Orders
-        # ============================================
-        if include_active_orders and data.get("active_orders"):
-            orders_data = data["active_orders"]
-
-            if orders_data and isinstance(orders_data, dict):
-                orders_table = orders_data.get("orders_table", "No active orders found")
-                total_orders = orders_data.get("total_returned", 0)
-
-                sections.append({
-                    "title": "Active Orders",
-                    "content": orders_table,
-                    "total_orders": total_orders,
-                    "emoji": "📋"
-                })
-            else:
-                sections.append({
-                    "title": "Active Orders",
-                    "content": "No active orders found",
-                    "total_orders": 0,
-                    "emoji": "📋"
-                })
-        elif include_active_orders and not data.get("active_orders"):
             sections.append({
                 "title": "Active Orders",
-                "content": "Failed to fetch active orders",
+                "content": orders_table,
+                "total_orders": total_orders,
+                "emoji": "📋"
+            })
+        else:
+            sections.append({
+                "title": "Active Orders",
+                "content": "No active orders found",
                 "total_orders": 0,
-                "emoji": "⚠️"
+                "emoji": "📋"
             })
-
-        # ============================================
-        # Build final formatted output
-        # ============================================
-        output_lines = ["Portfolio Overview", "=" * 80, ""]
-
-        for section in sections:
-            output_lines.append(f"{section['emoji']} {section['title']}:")
-            output_lines.append("-" * 80)
-            output_lines.append(section["content"])
-            output_lines.append("")
-
-        # Summary section
-        output_lines.append("📈 Summary:")
+    elif include_active_orders and not data.get("active_orders"):
+        sections.append({
+            "title": "Active Orders",
+            "content": "Failed to fetch active orders",
+            "total_orders": 0,
+            "emoji": "⚠️"
+        })
+
+    # ============================================
+    # Build final formatted output
+    # ============================================
+    output_lines = ["Portfolio Overview", "=" * 80, ""]
+
+    for section in sections:
+        output_lines.append(f"{section['emoji']} {section['title']}:")
         output_lines.append("-" * 80)
-
-        if include_balances:
-            balance_section = next((s for s in sections if s["title"] == "Token Balances"), None)
-            if balance_section and "total_value" in balance_section:
-                output_lines.append(f"Total Balance Value: ${balance_section['total_value']:.2f}")
-
-        if include_perp_positions:
-            perp_section = next((s for s in sections if s["title"] == "Perpetual Positions"), None)
-            if perp_section and "total_positions" in perp_section:
-                output_lines.append(f"Active Perpetual Positions: {perp_section['total_positions']}")
-
-        if include_lp_positions:
-            lp_section = next((s for s in sections if s["title"] == "LP Positions (CLMM)"), None)
-            if lp_section and "open_positions" in lp_section:
-                open_count = lp_section.get("open_positions", 0)
-                output_lines.append(f"Active LP Positions: {open_count}")
-
-        if include_active_orders:
-            orders_section = next((s for s in sections if s["title"] == "Active Orders"), None)
-            if orders_section and "total_orders" in orders_section:
-                output_lines.append(f"Active Orders: {orders_section['total_orders']}")
-
-        formatted_output = "\n".join(output_lines)
-
-        return {
-            "formatted_output": formatted_output,
-            "sections": sections,
-            "total_balance_value": total_value,
-            "filters": {
-                "account_names": account_names,
-                "connector_names": connector_names,
-                "include_balances": include_balances,
-                "include_perp_positions": include_perp_positions,
-                "include_lp_positions": include_lp_positions,
-                "include_active_orders": include_active_orders,
-            }
+        output_lines.append(section["content"])
+        output_lines.append("")
+
+    # Summary section
+    output_lines.append("📈 Summary:")
+    output_lines.append("-" * 80)
+
+    if include_balances:
+        balance_section = next((s for s in sections if s["title"] == "Token Balances"), None)
+        if balance_section and "total_value" in balance_section:
+            output_lines.append(f"Total Balance Value: ${balance_section['total_value']:.2f}")
+
+    if include_perp_positions:
+        perp_section = next((s for s in sections if s["title"] == "Perpetual Positions"), None)
+        if perp_section and "total_positions" in perp_section:
+            output_lines.append(f"Active Perpetual Positions: {perp_section['total_positions']}")
+
+    if include_lp_positions:
+        lp_section = next((s for s in sections if s["title"] == "LP Positions (CLMM)"), None)
+        if lp_section and "open_positions" in lp_section:
+            open_count = lp_section.get("open_positions", 0)
+            output_lines.append(f"Active LP Positions: {open_count}")
+
+    if include_active_orders:
+        orders_section = next((s for s in sections if s["title"] == "Active Orders"), None)
+        if orders_section and "total_orders" in orders_section:
+            output_lines.append(f"Active Orders: {orders_section['total_orders']}")
+
+    formatted_output = "\n".join(output_lines)
+
+    return {
+        "formatted_output": formatted_output,
+        "sections": sections,
+        "total_balance_value": total_value,
+        "filters": {
+            "account_names": account_names,
+            "connector_names": connector_names,
+            "include_balances": include_balances,
+            "include_perp_positions": include_perp_positions,
+            "include_lp_positions": include_lp_positions,
+            "include_active_orders": include_active_orders,
         }
-
-    except Exception as e:
-        logger.error(f"Error in get_portfolio_overview: {str(e)}", exc_info=True)
-        raise ToolError(f"Failed to get portfolio overview: {str(e)}")
+    }
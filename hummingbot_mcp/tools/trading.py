@@ -39,33 +39,34 @@ async def set_position_mode_and_leverage(
     if position_mode is None and leverage is None:
         raise ValueError("At least one of position_mode or leverage must be specified")
 
-    results = {}
-
-    # Set position mode
+    # Validate everything up front so an invalid leverage never follows an already-applied position mode
     if position_mode:
         position_mode = position_mode.upper()
-        if position_mode not in ["HEDGE", "ONE-WAY"]:
+        if position_mode not in {"HEDGE", "ONE-WAY"}:
             raise ValueError("Invalid position mode. Must be 'HEDGE' or 'ONE-WAY'")
 
-        position_mode_result = await client.trading.set_position_mode(
-            account_name=account_name, connector_name=connector_name, position_mode=position_mode
-        )
-        results["position_mode"] = position_mode_result
-
-    # Set leverage
     if leverage is not None:
         if not isinstance(leverage, int) or leverage <= 0:
             raise ValueError("Leverage must be a positive integer")
         if trading_pair is None:
             raise ValueError("Trading_pair must be specified when setting leverage")
 
-        leverage_result = await client.trading.set_leverage(
+    results = {}
+
+    # Set position mode first; leverage is only attempted once the mode change has succeeded
+    if position_mode:
+        results["position_mode"] = await client.trading.set_position_mode(
+            account_name=account_name, connector_name=connector_name, position_mode=position_mode
+        )
+
+    # Set leverage
+    if leverage is not None:
+        results["leverage"] = await client.trading.set_leverage(
             account_name=account_name,
             connector_name=connector_name,
             trading_pair=trading_pair,
             leverage=leverage,
         )
-        results["leverage"] = leverage_result
 
     return results
 